@@ -9,34 +9,52 @@ Features:
     - Dry-run mode (default) to preview changes
     - Atomic file writes to prevent corruption
     - Timestamped backups before modifications
+    - Parallel file processing across CPU cores
 
 Usage:
     python convert_h1_to_h2.py /path/to/vault              # Dry run (preview)
     python convert_h1_to_h2.py /path/to/vault --write      # Apply changes
     python convert_h1_to_h2.py /path/to/vault --exclude "drafts,templates"
+    python convert_h1_to_h2.py /path/to/vault --exclude-glob "archive*"
 """
 
 import argparse
+import codecs
+import fnmatch
+import functools
+import mmap
 import os
 import re
 import shutil
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple
 
+try:
+    # Optional accelerator for very large notes; the regex path is used without it
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+    np = None
+
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-class ConversionResult(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ConversionResult:
     """Result of processing a single Markdown file."""
     file_path: Path
     replacements: int
     modified: bool
     error: str | None = None
+    backup_path: Path | None = None
 
 
 class ConversionSummary(NamedTuple):
@@ -51,7 +69,65 @@ class ConversionSummary(NamedTuple):
 # CONSTANTS
 # =============================================================================
 
-DEFAULT_EXCLUDES = {".obsidian", ".git", "node_modules", ".trash", ".DS_Store"}
+DEFAULT_EXCLUDES = {
+    ".obsidian", ".git", "node_modules", ".trash", ".DS_Store",
+    ".venv", "venv", "__pycache__",
+    "_backups",  # this script's own backups must never be converted
+}
+
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Threads used to walk top-level vault folders concurrently
+SCAN_WORKERS = 8
+
+# Files at least this large are memory-mapped for the H1 prescreen
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Files at least this large use the compiled byte scanner when numba is installed
+NUMBA_MIN_BYTES = 8 * 1024 * 1024
+
+# Patterns are compiled once at import time and shared by every file processed
+
+# Regex: 0-3 leading spaces, then "# " (hash + space), then rest of line.
+# Lines are only split on "\n", so a CRLF line keeps its "\r" in the rest.
+_H1_PATTERN = re.compile(r"^( {0,3})# (.*)$", re.MULTILINE)
+
+# Same H1 prefix on raw bytes, used to skip files before decoding them.
+# Safe for both UTF-8 and Latin-1 since the pattern is pure ASCII.
+_H1_BYTES_PATTERN = re.compile(rb"^ {0,3}# ", re.MULTILINE)
+
+# Regex: a line whose leading whitespace, or the whitespace around a "---",
+# runs into a non-ASCII byte. Only the decoded str path knows whether such a
+# byte is Unicode whitespace (e.g. NBSP), so these files skip the byte scanner.
+_NON_ASCII_LINE_START_PATTERN = re.compile(
+    rb"^[\t\x0b\x0c\r\x1c-\x1f ]*(?:---[\t\x0b\x0c\r\x1c-\x1f ]*)?[\x80-\xff]",
+    re.MULTILINE
+)
+
+# Regex: a line that is exactly "---" once surrounding whitespace is ignored
+_FRONTMATTER_PATTERN = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
+# Regex: frontmatter, fenced code blocks and H1 prefixes as alternatives, so a
+# single left-to-right scan consumes protected regions whole and only stops on
+# H1 lines outside them. Unclosed frontmatter or fences run to end of content.
+_MARKDOWN_PATTERN = re.compile(
+    r"""
+    ^ (?:                                      # shared anchor: line starts only
+        (?P<frontmatter>
+            \A [^\S\n]* --- [^\S\n]* $         # "---" on the very first line
+            (?: \n .*? ^ [^\S\n]* --- [^\S\n]* $  # ...through the closing "---"
+              | .* )                           # ...or to the end if unclosed
+        )
+      | (?P<fence>
+            [^\S\n]* (?P<marker> ``` | ~~~ ) [^\n]*  # opening fence line
+            (?: \n .*? ^ [^\S\n]* (?P=marker) [^\n]*  # ...through the same marker
+              | .* )                           # ...or to the end if unclosed
+        )
+      | (?P<indent> \ {0,3} ) \#\             # H1 prefix: 0-3 spaces, "# "
+    )
+    """,
+    re.MULTILINE | re.DOTALL | re.VERBOSE
+)
 
 
 # =============================================================================
@@ -63,63 +139,164 @@ def is_hidden(path: Path) -> bool:
     return any(part.startswith(".") for part in path.parts)
 
 
-def should_exclude(path: Path, vault_root: Path, extra_excludes: set[str]) -> bool:
+def split_exclude_globs(patterns: set[str]) -> tuple[tuple[str, ...], ...]:
     """
-    Determine if a file path should be excluded from processing.
+    Split fnmatch-style folder patterns into their "/"-separated segments.
     
     Args:
-        path: Absolute path to the file being considered.
-        vault_root: Absolute path to the vault's root directory.
-        extra_excludes: Set of additional folder names to skip.
+        patterns: Glob patterns such as "archive*" or "projects/*/build".
     
     Returns:
-        True if the file should be skipped, False if it should be processed.
+        One tuple of segments per pattern, ready for matches_exclude_glob.
     """
-    try:
-        rel_path = path.relative_to(vault_root)
-    except ValueError:
-        return True
+    return tuple(tuple(p.strip("/").split("/")) for p in sorted(patterns))
+
+
+def matches_exclude_glob(rel_path: str, exclude_globs: tuple[tuple[str, ...], ...]) -> bool:
+    """
+    Check a vault-relative folder path against split exclude globs.
     
-    all_excludes = DEFAULT_EXCLUDES | extra_excludes
+    A single-segment pattern matches the folder's own name at any depth. A
+    pattern with "/" must match the whole relative path segment by segment,
+    so "*" never spans folders. Each segment is compared with fnmatch.fnmatch,
+    which is case-insensitive on Windows.
     
-    for part in rel_path.parts:
-        if part.startswith(".") or part in all_excludes:
-            return True
+    Args:
+        rel_path: Folder path relative to the vault, with "/" separators.
+        exclude_globs: Patterns as returned by split_exclude_globs.
     
+    Returns:
+        True if any pattern matches.
+    """
+    parts = rel_path.split("/")
+    for segments in exclude_globs:
+        if len(segments) == 1:
+            if fnmatch.fnmatch(parts[-1], segments[0]):
+                return True
+        elif len(segments) == len(parts) and all(
+            fnmatch.fnmatch(part, segment) for part, segment in zip(parts, segments)
+        ):
+            return True
     return False
 
 
-def find_markdown_files(vault_path: Path, extra_excludes: set[str]) -> list[Path]:
+def _list_directory(
+    root: str,
+    excludes: frozenset[str],
+    exclude_globs: tuple[tuple[str, ...], ...] = (),
+    prefix_len: int = 0
+) -> tuple[list[str], list[str]]:
+    """
+    List one directory with os.scandir, classifying entries by cached d_type.
+    
+    Hidden entries and entries named in excludes (folders or .md files) are
+    dropped, as are folders whose vault-relative path (found by slicing off
+    the first prefix_len characters) matches exclude_globs. Like os.walk,
+    symlinked folders are never descended into.
+    
+    Returns:
+        Tuple of (markdown file paths, subfolder paths to descend into).
+    """
+    md_files: list[str] = []
+    subdirs: list[str] = []
+    
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return md_files, subdirs
+    
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            
+            if entry.is_dir():
+                if name in excludes or entry.is_symlink():
+                    continue
+                if exclude_globs:
+                    rel_path = entry.path[prefix_len:].replace(os.sep, "/")
+                    if matches_exclude_glob(rel_path, exclude_globs):
+                        continue
+                subdirs.append(entry.path)
+            elif name.endswith(".md") and name not in excludes:
+                md_files.append(entry.path)
+    
+    return md_files, subdirs
+
+
+def _scan_markdown_files(
+    root: str,
+    excludes: frozenset[str],
+    exclude_globs: tuple[tuple[str, ...], ...] = (),
+    prefix_len: int = 0
+) -> list[str]:
+    """Recursively collect .md file paths under root as plain strings."""
+    md_files, subdirs = _list_directory(root, excludes, exclude_globs, prefix_len)
+    for subdir in subdirs:
+        md_files.extend(_scan_markdown_files(subdir, excludes, exclude_globs, prefix_len))
+    return md_files
+
+
+def find_markdown_files(
+    vault_path: Path,
+    extra_excludes: set[str],
+    sort: bool = False,
+    exclude_globs: set[str] | None = None
+) -> list[Path]:
     """
     Recursively find all Markdown files (.md) in the vault.
     
+    Each top-level folder is walked in its own thread so directory listing
+    latency overlaps, which matters most on cold caches and network drives.
+    
     Args:
         vault_path: Absolute path to the vault's root directory.
-        extra_excludes: Set of additional folder names to skip.
+        extra_excludes: Set of additional folder or file names to skip.
+        sort: If True, sort the result. Only worth it when the order is
+            visible to the user, e.g. verbose per-file output.
+        exclude_globs: fnmatch patterns for folders to prune before they are
+            listed (see matches_exclude_glob).
     
     Returns:
-        A sorted list of Path objects pointing to .md files.
+        A list of Path objects pointing to .md files, in directory order
+        unless sort is True.
     """
-    md_files = []
+    all_excludes = frozenset(DEFAULT_EXCLUDES | extra_excludes)
+    split_globs = split_exclude_globs(exclude_globs or set())
     
-    for root, dirs, files in os.walk(vault_path):
-        root_path = Path(root)
-        
-        # Modify dirs in-place to prevent os.walk from descending into excluded folders
-        dirs[:] = [
-            d for d in dirs
-            if not d.startswith(".") and d not in (DEFAULT_EXCLUDES | extra_excludes)
-        ]
-        
-        for filename in files:
-            if not filename.endswith(".md") or filename.startswith("."):
-                continue
-            
-            file_path = root_path / filename
-            if not should_exclude(file_path, vault_path, extra_excludes):
-                md_files.append(file_path)
+    vault_str = str(vault_path)
+    prefix_len = len(vault_str) if vault_str.endswith(os.sep) else len(vault_str) + 1
+    
+    md_files, subdirs = _list_directory(vault_str, all_excludes, split_globs, prefix_len)
     
-    return sorted(md_files)
+    scan = functools.partial(
+        _scan_markdown_files,
+        excludes=all_excludes,
+        exclude_globs=split_globs,
+        prefix_len=prefix_len
+    )
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for subtree_files in executor.map(scan, subdirs):
+            md_files.extend(subtree_files)
+    
+    if sort:
+        return sorted(Path(p) for p in md_files)
+    return [Path(p) for p in md_files]
+
+
+def decode_markdown(data: bytes) -> tuple[str, str]:
+    """
+    Decode file bytes (without BOM) as UTF-8, falling back to Latin-1.
+    
+    Returns:
+        Tuple of (content, encoding_used).
+    """
+    try:
+        return data.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        # Latin-1 maps every byte, so this cannot fail
+        return data.decode("latin-1"), "latin-1"
 
 
 # =============================================================================
@@ -136,6 +313,10 @@ def convert_h1_to_h2(content: str) -> tuple[str, int]:
     - Headings already H2 or deeper
     - Hashtags without space after # (e.g., #tag)
     - Indentation (up to 3 spaces before #)
+    - Line endings (LF or CRLF); only the "# " prefix of a line is rewritten
+    
+    A single regex pass matches protected regions and H1 prefixes as
+    alternatives; protected regions are passed through untouched.
     
     Args:
         content: The complete file content as a string.
@@ -143,77 +324,188 @@ def convert_h1_to_h2(content: str) -> tuple[str, int]:
     Returns:
         Tuple of (new_content, replacement_count).
     """
-    lines = content.split("\n")
-    result_lines = []
+    # Most notes have no H1 at all; skip the span scan entirely for them
+    if not _H1_PATTERN.search(content):
+        return content, 0
+    
+    # Without frontmatter or fences every match is a real H1, so a template
+    # subn needs no Python callback and counts exactly
+    if ("```" not in content and "~~~" not in content
+            and not _FRONTMATTER_PATTERN.match(content)):
+        return _H1_PATTERN.subn(r"\1## \2", content)
+    
     replacement_count = 0
     
-    # State tracking for protected regions
-    in_frontmatter = False
-    in_code_block = False
-    code_fence_pattern = None
+    def replace(match: re.Match) -> str:
+        nonlocal replacement_count
+        indent = match.group("indent")
+        if indent is None:
+            return match.group(0)
+        replacement_count += 1
+        return f"{indent}## "
     
-    # Regex: 0-3 leading spaces, then "# " (hash + space), then rest of line
-    h1_pattern = re.compile(r"^( {0,3})(# )(.*)$")
+    # Count via the callback: subn would also count the protected matches
+    new_content = _MARKDOWN_PATTERN.sub(replace, content)
     
-    for i, line in enumerate(lines):
-        # Handle YAML frontmatter (must start on line 0)
-        if i == 0 and line.strip() == "---":
-            in_frontmatter = True
-            result_lines.append(line)
-            continue
-        
-        if in_frontmatter:
-            result_lines.append(line)
-            if line.strip() == "---":
-                in_frontmatter = False
-            continue
+    # Every H1 was protected: hand back the original string rather than the
+    # identical copy that sub() just assembled
+    if replacement_count == 0:
+        return content, 0
+    
+    return new_content, replacement_count
+
+
+# =============================================================================
+# COMPILED BYTE SCANNER (OPTIONAL)
+# =============================================================================
+
+def _jit(func):
+    """Compile func with numba.njit when numba is installed, else return it as is."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+@_jit
+def _is_space(byte):
+    """ASCII equivalent of str.isspace() for a single byte other than newline."""
+    return byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31
+
+
+@_jit
+def _is_frontmatter_delimiter(src, start, end):
+    """Check whether src[start:end] is "---" once surrounding whitespace is ignored."""
+    while start < end and _is_space(src[start]):
+        start += 1
+    while end > start and _is_space(src[end - 1]):
+        end -= 1
+    return end - start == 3 and src[start] == 45 and src[start + 1] == 45 and src[start + 2] == 45
+
+
+@_jit
+def _convert_kernel(src, dst):
+    """
+    Line-by-line H1 -> H2 state machine over a byte buffer.
+    
+    Mirrors convert_h1_to_h2 (frontmatter, ``` and ~~~ fences, 0-3 spaces
+    before "# "), treating only ASCII characters as whitespace. Callers must
+    route input matching _NON_ASCII_LINE_START_PATTERN to the str path.
+    
+    Args:
+        src: Input bytes as a uint8 array.
+        dst: Output buffer with room for one extra byte per converted heading.
+    
+    Returns:
+        Tuple of (bytes written to dst, replacement_count).
+    """
+    n = len(src)
+    i = 0
+    out = 0
+    count = 0
+    first_line = True
+    in_frontmatter = False
+    fence = 0  # byte value of the open fence marker, 0 outside code blocks
+    
+    while i < n:
+        line_end = i
+        while line_end < n and src[line_end] != 10:
+            line_end += 1
         
-        # Handle fenced code blocks
-        stripped = line.lstrip()
+        text_start = i
+        while text_start < line_end and _is_space(src[text_start]):
+            text_start += 1
+        starts_fence = (
+            text_start + 3 <= line_end
+            and (src[text_start] == 96 or src[text_start] == 126)
+            and src[text_start + 1] == src[text_start]
+            and src[text_start + 2] == src[text_start]
+        )
         
-        if not in_code_block:
-            if stripped.startswith("```"):
-                in_code_block = True
-                code_fence_pattern = "```"
-                result_lines.append(line)
-                continue
-            elif stripped.startswith("~~~"):
-                in_code_block = True
-                code_fence_pattern = "~~~"
-                result_lines.append(line)
-                continue
+        hash_pos = -1
+        if first_line and _is_frontmatter_delimiter(src, i, line_end):
+            in_frontmatter = True
+        elif in_frontmatter:
+            if _is_frontmatter_delimiter(src, i, line_end):
+                in_frontmatter = False
+        elif fence != 0:
+            if starts_fence and src[text_start] == fence:
+                fence = 0
+        elif starts_fence:
+            fence = src[text_start]
         else:
-            if stripped.startswith(code_fence_pattern):
-                in_code_block = False
-                code_fence_pattern = None
-            result_lines.append(line)
-            continue
+            pos = i
+            while pos < line_end and pos - i < 3 and src[pos] == 32:
+                pos += 1
+            if pos + 1 < line_end and src[pos] == 35 and src[pos + 1] == 32:
+                hash_pos = pos
+        first_line = False
         
-        # Check for H1 heading and convert to H2
-        match = h1_pattern.match(line)
-        if match:
-            leading_spaces = match.group(1)
-            rest_of_line = match.group(3)
-            new_line = f"{leading_spaces}## {rest_of_line}"
-            result_lines.append(new_line)
-            replacement_count += 1
-        else:
-            result_lines.append(line)
+        if hash_pos >= 0:
+            # Insert one extra "#" right before the existing one
+            length = hash_pos - i
+            dst[out:out + length] = src[i:hash_pos]
+            out += length
+            dst[out] = 35
+            out += 1
+            i = hash_pos
+            count += 1
+        
+        length = line_end - i
+        dst[out:out + length] = src[i:line_end]
+        out += length
+        if line_end < n:
+            dst[out] = 10
+            out += 1
+        i = line_end + 1
     
-    return "\n".join(result_lines), replacement_count
+    return out, count
+
+
+def convert_h1_to_h2_numba(data: bytes) -> tuple[bytes, int]:
+    """
+    Convert H1 headings to H2 on raw UTF-8 or Latin-1 bytes.
+    
+    Uses the numba-compiled scanner when numba is installed, which avoids
+    decoding very large notes at all. Without numba, or when a line starts
+    with non-ASCII bytes that might be Unicode whitespace, the bytes are
+    decoded like process_file does and converted with convert_h1_to_h2, so
+    the result never depends on which path was taken.
+    
+    Args:
+        data: The file content as bytes, without a BOM.
+    
+    Returns:
+        Tuple of (new_data, replacement_count).
+    """
+    if numba is None or _NON_ASCII_LINE_START_PATTERN.search(data):
+        content, encoding = decode_markdown(data)
+        new_content, replacements = convert_h1_to_h2(content)
+        if replacements == 0:
+            return data, 0
+        return new_content.encode(encoding), replacements
+    
+    # Every converted heading contains a "# ", so this bounds the growth
+    dst = np.empty(len(data) + data.count(b"# "), dtype=np.uint8)
+    length, replacements = _convert_kernel(np.frombuffer(data, dtype=np.uint8), dst)
+    
+    if replacements == 0:
+        return data, 0
+    return dst[:length].tobytes(), replacements
 
 
 # =============================================================================
 # FILE SAFETY FUNCTIONS
 # =============================================================================
 
-def create_backup(file_path: Path, vault_root: Path) -> Path:
+def create_backup(file_path: Path, vault_root: Path, timestamp: str | None = None) -> Path:
     """
     Create a timestamped backup of a file in _backups folder.
     
     Args:
         file_path: Absolute path to the file to backup.
         vault_root: Absolute path to the vault's root directory.
+        timestamp: Timestamp string for the backup name. Pass the same value
+            for every file in a run to group its backups; defaults to now.
     
     Returns:
         Path to the newly created backup file.
@@ -228,7 +520,8 @@ def create_backup(file_path: Path, vault_root: Path) -> Path:
     except ValueError:
         backup_subdir = backup_dir
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)
     backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
     backup_path = backup_subdir / backup_name
     
@@ -236,19 +529,28 @@ def create_backup(file_path: Path, vault_root: Path) -> Path:
     return backup_path
 
 
-def write_file_atomic(file_path: Path, content: str, encoding: str = "utf-8") -> None:
+def write_file_atomic(
+    file_path: Path,
+    content: str | bytes,
+    encoding: str = "utf-8",
+    bom: bool = False
+) -> None:
     """
     Write content to a file atomically using a temporary file.
     
     Writes to a temp file first, then atomically renames to prevent corruption
-    if the program crashes mid-write.
+    if the program crashes mid-write. Content is encoded once up front and
+    written with raw os.write calls on the temp file's descriptor.
     
     Args:
         file_path: Destination file path.
-        content: String content to write.
-        encoding: Character encoding (default: UTF-8).
+        content: String content to write, or bytes that are already encoded.
+        encoding: Character encoding for str content (default: UTF-8).
+        bom: If True, write a UTF-8 byte order mark before the content, e.g.
+            because the original file started with one.
     """
     dir_path = file_path.parent
+    data = content.encode(encoding) if isinstance(content, str) else content
     
     # Create temp file in same directory (required for atomic rename)
     fd, temp_path = tempfile.mkstemp(
@@ -258,8 +560,16 @@ def write_file_atomic(file_path: Path, content: str, encoding: str = "utf-8") ->
     )
     
     try:
-        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
-            f.write(content)
+        # Write the pre-encoded bytes straight to the fd (no text-layer buffering);
+        # os.write may accept only part of a large buffer, so loop until done
+        try:
+            for chunk in (codecs.BOM_UTF8, data) if bom else (data,):
+                remaining = memoryview(chunk)
+                while remaining:
+                    written = os.write(fd, remaining)
+                    remaining = remaining[written:]
+        finally:
+            os.close(fd)
         Path(temp_path).replace(file_path)
     except Exception:
         try:
@@ -273,12 +583,44 @@ def write_file_atomic(file_path: Path, content: str, encoding: str = "utf-8") ->
 # FILE PROCESSING
 # =============================================================================
 
+def _has_h1_candidate(buffer: bytes | mmap.mmap) -> bool:
+    """Run the bytes H1 prescreen, also checking the first line after a UTF-8 BOM."""
+    if buffer[:3] == codecs.BOM_UTF8 and _H1_BYTES_PATTERN.match(buffer[3:8]):
+        return True
+    return _H1_BYTES_PATTERN.search(buffer) is not None
+
+
+def read_markdown_bytes(file_path: Path) -> bytes | None:
+    """
+    Read a file's raw bytes, unless it cannot contain an H1 heading.
+    
+    Files of MMAP_MIN_BYTES or more are memory-mapped, so the prescreen runs
+    directly on the page cache and a large note without an H1 is never copied
+    into Python memory.
+    
+    Args:
+        file_path: Absolute path to the Markdown file.
+    
+    Returns:
+        The file's bytes (including any BOM), or None if no line starts with
+        an H1 prefix.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            data = f.read()
+            return data if _has_h1_candidate(data) else None
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:] if _has_h1_candidate(mm) else None
+
+
 def process_file(
     file_path: Path,
     vault_root: Path,
     dry_run: bool,
     create_backups: bool,
-    verbose: bool
+    verbose: bool,
+    timestamp: str | None = None
 ) -> ConversionResult:
     """
     Process a single Markdown file: read, convert, and optionally write.
@@ -288,34 +630,32 @@ def process_file(
         vault_root: Absolute path to the vault root.
         dry_run: If True, only count changes without modifying.
         create_backups: If True, create backup before writing.
-        verbose: If True, print per-file progress.
+        verbose: If True, print per-file progress. Leave False when running
+            inside a worker pool; the caller reports results instead.
+        timestamp: Shared run timestamp used to name backups (default: now).
     
     Returns:
         ConversionResult with processing details.
     """
     try:
-        # Try multiple encodings
-        content = None
-        encoding_used = "utf-8"
-        
-        for encoding in ["utf-8", "utf-8-sig", "latin-1"]:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    content = f.read()
-                encoding_used = encoding
-                break
-            except UnicodeDecodeError:
-                continue
+        # Read once, then decode in memory: UTF-8 (with or without BOM), else Latin-1
+        data = read_markdown_bytes(file_path)
+        if data is None:
+            return ConversionResult(file_path=file_path, replacements=0, modified=False)
         
-        if content is None:
-            return ConversionResult(
-                file_path=file_path,
-                replacements=0,
-                modified=False,
-                error="Could not decode file with supported encodings"
-            )
+        # Remember the BOM and write it back as-is rather than via utf-8-sig
+        encoding_used = "utf-8"
+        had_bom = data.startswith(codecs.BOM_UTF8)
+        if had_bom:
+            data = data[len(codecs.BOM_UTF8):]
         
-        new_content, replacements = convert_h1_to_h2(content)
+        if (numba is not None and len(data) >= NUMBA_MIN_BYTES
+                and not _NON_ASCII_LINE_START_PATTERN.search(data)):
+            # Very large ASCII-indented note: convert the bytes directly
+            new_content, replacements = convert_h1_to_h2_numba(data)
+        else:
+            content, encoding_used = decode_markdown(data)
+            new_content, replacements = convert_h1_to_h2(content)
         
         if replacements == 0:
             return ConversionResult(file_path=file_path, replacements=0, modified=False)
@@ -327,14 +667,20 @@ def process_file(
         if dry_run:
             return ConversionResult(file_path=file_path, replacements=replacements, modified=False)
         
+        backup_path = None
         if create_backups:
-            backup_path = create_backup(file_path, vault_root)
+            backup_path = create_backup(file_path, vault_root, timestamp)
             if verbose:
                 print(f"    Backup created: {backup_path.name}")
         
-        write_file_atomic(file_path, new_content, encoding=encoding_used)
+        write_file_atomic(file_path, new_content, encoding=encoding_used, bom=had_bom)
         
-        return ConversionResult(file_path=file_path, replacements=replacements, modified=True)
+        return ConversionResult(
+            file_path=file_path,
+            replacements=replacements,
+            modified=True,
+            backup_path=backup_path
+        )
     
     except Exception as e:
         return ConversionResult(file_path=file_path, replacements=0, modified=False, error=str(e))
@@ -345,7 +691,8 @@ def run_conversion(
     dry_run: bool,
     create_backups: bool,
     verbose: bool,
-    extra_excludes: set[str]
+    extra_excludes: set[str],
+    exclude_globs: set[str] | None = None
 ) -> ConversionSummary:
     """
     Run the H1 to H2 conversion on the entire vault.
@@ -355,7 +702,8 @@ def run_conversion(
         dry_run: If True, only preview changes.
         create_backups: If True, backup files before modifying.
         verbose: If True, print per-file details.
-        extra_excludes: Set of additional folder names to skip.
+        extra_excludes: Set of additional folder or file names to skip.
+        exclude_globs: fnmatch patterns for folders to skip.
     
     Returns:
         ConversionSummary with aggregate statistics.
@@ -369,22 +717,59 @@ def run_conversion(
         print(f"Backups: {'Enabled' if create_backups else 'Disabled'}")
     if extra_excludes:
         print(f"Extra excludes: {', '.join(sorted(extra_excludes))}")
+    if exclude_globs:
+        print(f"Exclude globs: {', '.join(sorted(exclude_globs))}")
     print(f"{'=' * 60}\n")
     
-    md_files = find_markdown_files(vault_path, extra_excludes)
+    # Sorting only matters when per-file lines are printed
+    md_files = find_markdown_files(
+        vault_path, extra_excludes, sort=verbose, exclude_globs=exclude_globs
+    )
     print(f"Found {len(md_files)} Markdown file(s) to scan.\n")
     
     if verbose:
         print("Processing files:")
     
-    results: list[ConversionResult] = []
-    for file_path in md_files:
-        result = process_file(file_path, vault_path, dry_run, create_backups, verbose)
-        results.append(result)
+    # One timestamp per run so all of its backups can be found together
+    run_timestamp = datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)
     
-    files_changed = sum(1 for r in results if r.replacements > 0)
-    total_replacements = sum(r.replacements for r in results)
-    errors = [f"{r.file_path}: {r.error}" for r in results if r.error]
+    worker = functools.partial(
+        process_file,
+        vault_root=vault_path,
+        dry_run=dry_run,
+        create_backups=create_backups,
+        verbose=False,
+        timestamp=run_timestamp
+    )
+    
+    # Dry runs are pure read + regex, so threads avoid the pickling cost of
+    # shipping results between processes. Writes use processes to spread the
+    # conversion work across cores. Both pools size themselves from the CPU
+    # count (processes are capped at 61 on Windows, where more is an error).
+    executor_class = ThreadPoolExecutor if dry_run else ProcessPoolExecutor
+    with executor_class() as executor:
+        results = list(executor.map(worker, md_files, chunksize=32))
+    
+    # Tally in a single pass. Workers never print, so per-file details are
+    # reported here in the main process and stay in file order.
+    files_changed = 0
+    total_replacements = 0
+    errors: list[str] = []
+    
+    for result in results:
+        if result.error:
+            errors.append(f"{result.file_path}: {result.error}")
+        if result.replacements == 0:
+            continue
+        
+        files_changed += 1
+        total_replacements += result.replacements
+        
+        if verbose:
+            print(f"  {result.file_path.relative_to(vault_path)}: "
+                  f"{result.replacements} H1 heading(s) found")
+            if result.backup_path is not None:
+                print(f"    Backup created: {result.backup_path.name}")
     
     print(f"\n{'=' * 60}")
     print("SUMMARY")
@@ -423,7 +808,7 @@ def run_conversion(
 # =============================================================================
 
 def parse_excludes(exclude_str: str | None) -> set[str]:
-    """Parse comma-separated exclude string into a set of folder names."""
+    """Parse comma-separated exclude string into a set of folder names or patterns."""
     if not exclude_str:
         return set()
     return {e.strip() for e in exclude_str.split(",") if e.strip()}
@@ -440,6 +825,7 @@ Examples:
   python convert_h1_to_h2.py /path/to/vault --write      # Apply changes
   python convert_h1_to_h2.py /path/to/vault --write -v   # Verbose
   python convert_h1_to_h2.py /path/to/vault --exclude "drafts,archive"
+  python convert_h1_to_h2.py /path/to/vault --exclude-glob "archive*,projects/*/build"
 
 Safety:
   - Dry run is the default. Use --write to modify files.
@@ -460,7 +846,12 @@ Safety:
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Print per-file details")
     parser.add_argument("--exclude", type=str, default="",
-                        help="Comma-separated folder names to exclude")
+                        help="Comma-separated folder or file names to exclude")
+    parser.add_argument("--exclude-glob", type=str, default="",
+                        help="Comma-separated fnmatch patterns for folders to exclude. "
+                             "A pattern without '/' matches folder names at any depth; "
+                             "one with '/' matches the vault-relative path, and '*' "
+                             "never spans folders")
     
     args = parser.parse_args()
     
@@ -477,13 +868,15 @@ Safety:
     dry_run = not args.write
     create_backups = args.backup and not args.no_backup
     extra_excludes = parse_excludes(args.exclude)
+    exclude_globs = parse_excludes(args.exclude_glob)
     
     summary = run_conversion(
         vault_path=vault_path,
         dry_run=dry_run,
         create_backups=create_backups,
         verbose=args.verbose,
-        extra_excludes=extra_excludes
+        extra_excludes=extra_excludes,
+        exclude_globs=exclude_globs
     )
     
     return 1 if summary.errors else 0